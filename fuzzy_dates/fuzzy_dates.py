@@ -1,6 +1,5 @@
-import calendar
 import re
-from datetime import date, datetime
+from datetime import date
 from django import forms
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -10,7 +9,16 @@ from django.db import models
 # This regex matches dates in the format yyyy, yyyy.mm, or yyyy.mm.dd (other
 # separators are allowed, too, e.g., yyyy-mm-dd or yyyy/mm/dd). Thanks to
 # https://stackoverflow.com/questions/15474741/python-regex-optional-capture-group
-DATE_PATTERN = re.compile(r"(\d{4})(?:[.\-/](\d{2})(?:[.\-/](\d{2}))?)?$")
+# We anchor with "\Z" rather than "$" so that a trailing newline is rejected
+# rather than silently accepted ("$" matches just before a final "\n").
+DATE_PATTERN = re.compile(r"(\d{4})(?:[.\-/](\d{2})(?:[.\-/](\d{2}))?)?\Z", re.ASCII)
+# Fixed-width pattern for the most common fully-specified case, so the
+# engine doesn't have to explore DATE_PATTERN's nested optional groups.
+_FULL_DATE_PATTERN = re.compile(r"(\d{4})[.\-/](\d{2})[.\-/](\d{2})\Z", re.ASCII)
+# Bind the matchers once so the hot construction paths call the bound
+# method directly instead of resolving .match on the pattern each time.
+_date_match = DATE_PATTERN.match
+_full_date_match = _FULL_DATE_PATTERN.match
 DATE_FIELD_ORDER = getattr(settings, "FUZZY_DATE_FIELD_ORDER", "mdy").lower()
 DATE_FIELD_SEPARATOR = getattr(settings, "FUZZY_DATE_FIELD_SEPARATOR", "/")
 DATE_FIELD_PLACEHOLDERS = {
@@ -32,19 +40,53 @@ if len(DATE_FIELD_ORDER) != 3 or set(DATE_FIELD_ORDER) != set("ymd"):
 if DATE_FIELD_SEPARATOR not in ("-", ".", "/"):
     raise ValueError("The FUZZY_DATE_FIELD_SEPARATOR setting must be one of '-', '.', or '/'.")
 
+# DATE_FIELD_ORDER is fixed for the life of the process, so the permutation
+# from storage order ("ymd") to the user's preferred order can be computed
+# once here rather than rebuilding a dict on every call that reorders the
+# date components.
+_ORDER_INDICES = tuple("ymd".index(el) for el in DATE_FIELD_ORDER)
+
+# Month lengths for non-leap years, indexed by month number. Together with
+# the leap-year test below, this lets us validate a date without building a
+# throwaway datetime.date object on every construction.
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+# The widget attrs are identical for every FuzzyDateWidget, so build the
+# dicts once here instead of once per widget construction. Sharing them is
+# safe because forms.Widget copies the attrs dict it is given.
+_NUMBER_INPUT_ATTRS = tuple(
+    {"min": 1, "placeholder": DATE_FIELD_PLACEHOLDERS[el]} for el in DATE_FIELD_ORDER
+)
+
 
 # We use a custom metaclass to normalize parameters before they are passed to
 # the class's "__new__()" and "__init__()" methods.  It also allows FuzzyDate
 # instances to be initialized either with a string or via keyword arguments.
 class CustomMeta(type):
     def __call__(cls, seed=None, *args, **kwargs):
+        if isinstance(seed, cls):
+            # Already parsed and validated; since instances are immutable
+            # strings, handing the same object back is safe and skips the
+            # whole pipeline below.
+            return seed
         if seed:
             if isinstance(seed, str):
-                if m := DATE_PATTERN.match(seed):
+                # Most strings are either a bare year or a fully-specified
+                # date, so try the cheap tests for those shapes first and
+                # keep the general pattern as the fallback.
+                if len(seed) == 4 and seed.isascii() and seed.isdigit():
+                    year, month, day = seed, None, None
+                elif len(seed) == 10 and (m := _full_date_match(seed)):
+                    year, month, day = m.groups()
+                elif m := _date_match(seed):
                     year, month, day = m.groups()
                 else:
                     raise ValueError("Dates given as a string must be formatted as yyyy, yyyy.mm, or yyyy.mm.dd")
-            elif isinstance(seed, date) or isinstance(seed, datetime):
+            elif isinstance(seed, date):  # datetime is a date subclass, so this covers both
                 year, month, day = seed.year, seed.month, seed.day
             else:
                 raise TypeError("Only a string, a date, or a datetime can be passed as an initialization argument")
@@ -64,25 +106,43 @@ class CustomMeta(type):
         month = month or fuzzy_value
         day = day or fuzzy_value
 
-        try:
-            # Check that values are valid, replacing any fuzzy values with 1. This
-            # lets us eliminate invalid dates like 2000.13.01 or 2000.01.32.
-            int_year = int(year)
-            int_month = int(month) if month != fuzzy_value else 1
-            int_day = int(day) if day != fuzzy_value else 1
-            if int_year < 1000 or int_year > 9999:
-                # Keep the year within this range as years outside it would break
-                # sorting (e.g., "900" > "1000" alphanumerically speaking). Later
-                # on I might try to relax this restriction by padding short years
-                # with zeros, but it would take some doing.
-                raise ValueError("The year must be no less than 1000 and no greater than 9999.")
-            # else
-            date(year=int_year, month=int_month, day=int_day)
-        except ValueError as e:
-            raise e
-
-        kwargs = {"y": f"{year}", "m": f"{month:>02}", "d": f"{day:>02}"}
-        return super().__call__(*args, **kwargs)
+        # Check that values are valid, replacing any fuzzy values with 1. This
+        # lets us eliminate invalid dates like 2000.13.01 or 2000.01.32.
+        int_year = int(year)
+        int_month = int(month) if month != fuzzy_value else 1
+        int_day = int(day) if day != fuzzy_value else 1
+        if int_year < 1000 or int_year > 9999:
+            # Keep the year within this range as years outside it would break
+            # sorting (e.g., "900" > "1000" alphanumerically speaking). Later
+            # on I might try to relax this restriction by padding short years
+            # with zeros, but it would take some doing.
+            raise ValueError("The year must be no less than 1000 and no greater than 9999.")
+        # else
+        if not 1 <= int_month <= 12:
+            raise ValueError("month must be in 1..12")
+        days_in_month = _DAYS_IN_MONTH[int_month]
+        if int_month == 2 and _is_leap(int_year):
+            days_in_month = 29
+        if not 1 <= int_day <= days_in_month:
+            raise ValueError("day is out of range for month")
+
+        # Values usually arrive as digit strings (the regex and DB paths), so
+        # zero-padding with str.zfill skips the int round-trip that f-string
+        # formatting would need. Ints still arrive via the form field's
+        # kwargs path and from date/datetime seeds.
+        kwargs = {
+            "y": year if isinstance(year, str) else str(year),
+            "m": month.zfill(2) if isinstance(month, str) else f"{month:02}",
+            "d": day.zfill(2) if isinstance(day, str) else f"{day:02}",
+        }
+        instance = super().__call__(*args, **kwargs)
+        # Keep the ints we just parsed so get_range and friends don't have to
+        # re-parse the strings. A value of 0 stands in for a fuzzy month or
+        # day, mirroring the "00" placeholder in the stored string.
+        instance._y_int = int_year
+        instance._m_int = int_month if month != fuzzy_value else 0
+        instance._d_int = int_day if day != fuzzy_value else 0
+        return instance
 
 
 # All dates are stored in the DB as strings formatted as "yyyy.mm.dd". Using
@@ -91,60 +151,128 @@ class CustomMeta(type):
 # a month), we use a value of "00" in place of the missing month and/or day.
 # Fuzzy dates can then be sorted with non-fuzzy dates.
 class FuzzyDate(str, metaclass=CustomMeta):
+    # str itself carries no __dict__, so declaring slots here means each
+    # instance is just the string payload plus six fixed attribute slots —
+    # no per-instance dict. That adds up when querysets materialize many
+    # FuzzyDate values, and attribute access becomes a direct descriptor
+    # load as a bonus.
+    __slots__ = ("year", "month", "day", "_y_int", "_m_int", "_d_int", "_is_fuzzy")
+
     def __new__(cls, **kwargs):
-        return super().__new__(cls, "{y}.{m}.{d}".format(**kwargs))
+        return super().__new__(cls, f"{kwargs['y']}.{kwargs['m']}.{kwargs['d']}")
 
     def __init__(self, **kwargs):
         self.year = kwargs["y"]
         self.month = kwargs["m"] if kwargs["m"] != "00" else ""
         self.day = kwargs["d"] if kwargs["d"] != "00" else ""
+        self._is_fuzzy = self.day == ""
         return super().__init__()
 
     def __repr__(self):
         return "FuzzyDate({})".format(super().__repr__())
 
     def __str__(self):
-        data_dict = dict(zip("ymd", self.as_list()))
-        return DATE_FIELD_SEPARATOR.join(
-            [data_dict[el].lstrip(TRIM_CHAR) for el in DATE_FIELD_ORDER if data_dict[el]]
-        )
+        values = (self.year, self.month, self.day)
+        if TRIM_CHAR:
+            return DATE_FIELD_SEPARATOR.join(
+                [values[i].lstrip(TRIM_CHAR) for i in _ORDER_INDICES if values[i]]
+            )
+        # In the default configuration TRIM_CHAR is "", which makes lstrip a
+        # per-component no-op method call; skip it entirely.
+        return DATE_FIELD_SEPARATOR.join([values[i] for i in _ORDER_INDICES if values[i]])
     
     def as_list(self):
         return [self.year, self.month, self.day]
 
+    @classmethod
+    def _from_db(cls, value):
+        # Values coming from the DB were written by us and are trusted to be
+        # in the canonical "yyyy.mm.dd" format, so we can skip the regex and
+        # revalidation that CustomMeta.__call__ performs and build the
+        # instance directly. This runs once per row in querysets, so it pays
+        # to keep it lean.
+        instance = str.__new__(cls, value)
+        year, month, day = value.split(".")
+        instance.year = year
+        instance.month = month if month != "00" else ""
+        instance.day = day if day != "00" else ""
+        instance._y_int = int(year)
+        instance._m_int = int(month)
+        instance._d_int = int(day)
+        instance._is_fuzzy = instance.day == ""
+        return instance
+
+    @classmethod
+    def _unchecked(cls, y, m, d):
+        # Builds an instance from integer components the library itself just
+        # produced (e.g., the endpoints in get_range), skipping the
+        # validation in CustomMeta.__call__. A month or day of 0 means
+        # "fuzzy", mirroring the "00" placeholder in the stored string.
+        instance = str.__new__(cls, f"{y}.{m:02}.{d:02}")
+        instance.year = f"{y}"
+        instance.month = f"{m:02}" if m else ""
+        instance.day = f"{d:02}" if d else ""
+        instance._y_int = y
+        instance._m_int = m
+        instance._d_int = d
+        instance._is_fuzzy = not d
+        return instance
+
+    @classmethod
+    def from_many(cls, values):
+        # Bulk counterpart to _from_db for code that pulls raw date strings
+        # straight out of the DB, e.g. queryset.values_list("date", flat=True).
+        # The constructor is bound once and the loop runs as a list
+        # comprehension, so per-value overhead stays minimal. Empty values
+        # (None or "") pass through unchanged, mirroring from_db_value.
+        from_db = cls._from_db
+        return [from_db(value) if value else value for value in values]
+
     def get_range(self):
-        start_year = self.year
-        start_month = self.month or "01"
-        start_day = self.day or "01"
+        start_month = self._m_int or 1
+        start_day = self._d_int or 1
 
-        end_year = self.year
-        end_month = self.month or "12"
-        end_day = self.day or str(calendar.monthrange(int(end_year), 12)[1])
+        end_month = self._m_int or 12
+        end_day = self._d_int
+        if not end_day:
+            if end_month == 2 and _is_leap(self._y_int):
+                end_day = 29
+            else:
+                end_day = _DAYS_IN_MONTH[end_month]
 
-        return FuzzyDate(y=start_year, m=start_month, d=start_day), FuzzyDate(y=end_year, m=end_month, d=end_day)
+        return (
+            FuzzyDate._unchecked(self._y_int, start_month, start_day),
+            FuzzyDate._unchecked(self._y_int, end_month, end_day),
+        )
     
     @property
     def is_fuzzy(self):
-        return self.day == ""
+        # Computed once at construction; instances are immutable, so the
+        # cached flag can never go stale.
+        return self._is_fuzzy
 
 
 class FuzzyDateWidget(forms.MultiWidget):
     def __init__(self, attrs=None):
         # Define the input widgets in the user's preferred order.
-        widgets = [
-            forms.NumberInput(attrs={
-                "min": 1, "placeholder": DATE_FIELD_PLACEHOLDERS[el]
-            }) for el in DATE_FIELD_ORDER
-        ]
+        widgets = [forms.NumberInput(attrs=number_attrs) for number_attrs in _NUMBER_INPUT_ATTRS]
         super().__init__(widgets, attrs)
 
     def decompress(self, value):
         if value:  # will be a FuzzyDate object
-            data_dict = dict(zip("ymd", value.as_list()))
-            return [data_dict[el] for el in DATE_FIELD_ORDER]  # rearrange to the user's preferred order
+            values = (value.year, value.month, value.day)
+            return [values[i] for i in _ORDER_INDICES]  # rearrange to the user's preferred order
         return ["", "", ""]
 
 
+# A single validator instance with our customized message, shared by all
+# the subfields of every FuzzyDateFormField. Validators hold no per-field
+# state (Django shares default_validators across fields the same way), so
+# building this once replaces the loop that used to rewrite validator
+# messages on every form construction.
+_MIN_VALUE_VALIDATOR = MinValueValidator(1, message="Ensure all values are greater than 1.")
+
+
 class FuzzyDateFormField(forms.MultiValueField):
 
     def __init__(self, *args, **kwargs):
@@ -152,16 +280,12 @@ class FuzzyDateFormField(forms.MultiValueField):
                                         # models.CharField, but it's not valid for forms.MultiValueField
         fields = [
             forms.IntegerField(
-                min_value=1, required=DATE_FIELD_REQUIRED[el]
+                required=DATE_FIELD_REQUIRED[el], validators=[_MIN_VALUE_VALIDATOR]
             ) for el in DATE_FIELD_ORDER
         ]
         kwargs["require_all_fields"] = False
         super().__init__(fields, *args, **kwargs)
         self.widget = FuzzyDateWidget()
-        for field in fields:
-            for validator in field.validators:
-                if isinstance(validator, MinValueValidator):
-                    validator.message = "Ensure all values are greater than 1."
 
     def compress(self, data_list):
         if data_list:
@@ -186,14 +310,41 @@ class FuzzyDateField(models.CharField):
     def from_db_value(self, value, expression, connection):
         if value:
             # Values coming from the DB should be in the format yyyy.mm.dd
-            return FuzzyDate(value)
+            return FuzzyDate._from_db(value)
         # else
         return value
 
     def to_python(self, value):
         if value and not isinstance(value, FuzzyDate):
+            # Most values funneled through here are strings this package
+            # wrote to the DB in the canonical "yyyy.mm.dd" format. A cheap
+            # shape check lets those skip the regex and revalidation;
+            # anything else falls through to the full parsing path below.
+            if (
+                isinstance(value, str)
+                and len(value) == 10
+                and value.isascii()  # keep parity with the re.ASCII patterns below
+                and value[4] == "."
+                and value[7] == "."
+                and value[:4].isdecimal()
+                and value[5:7].isdecimal()
+                and value[8:].isdecimal()
+            ):
+                # Trust, but assert cheaply: _from_db has already parsed the
+                # ints, so bounds-check them (0 being the fuzzy placeholder)
+                # before handing the instance back. Anything out of range
+                # falls through to the validating path below and raises
+                # there, just as it did before this fast path existed.
+                candidate = FuzzyDate._from_db(value)
+                month = candidate._m_int
+                if candidate._y_int >= 1000 and month <= 12:
+                    days_in_month = (
+                        29 if month == 2 and _is_leap(candidate._y_int) else _DAYS_IN_MONTH[month]
+                    )
+                    if candidate._d_int <= days_in_month:
+                        return candidate
             try:
-                if m := DATE_PATTERN.match(value):
+                if m := _date_match(value):
                     y, m, d = m.groups()
                     value = FuzzyDate(y=y, m=m, d=d)
                 else: